@@ -13,13 +13,37 @@ Responsibilities:
 - Report audit results
 """
 
-import re
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Final, Optional
 
 
-@dataclass
+# Upper bound on threads used to read agent files concurrently
+MAX_AUDIT_WORKERS = 32
+
+# Parsed agent files are cached outside the target project (one JSON file per
+# project), keyed by file name in .claude/agents/ and validated by (mtime, size)
+AUDIT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "orchestrator" / "audit"
+AUDIT_CACHE_VERSION = 1
+
+# Markdown files in .claude/agents/ that are not agent definitions
+SKIP_AGENT_FILES = frozenset({"AGENTS.md"})
+
+# Sections AGENTS.md must contain, with the lowercase strings that satisfy each
+REQUIRED_SECTIONS: Final = (
+    ("Agent Registry", ("agent registry", "## agents")),
+    ("Ownership Matrix", ("ownership matrix",)),
+    ("Routing Table", ("routing table",)),
+)
+
+
+@dataclass(slots=True)
 class DiscoveredAgent:
     """An agent discovered in the target project."""
     name: str
@@ -29,7 +53,7 @@ class DiscoveredAgent:
     never_touches: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     """Result of auditing a target project."""
     project_path: Path
@@ -37,6 +61,7 @@ class AuditResult:
     has_agents_dir: bool = False
     has_agents_md: bool = False
     agents_md_valid: bool = False
+    agents_md_content: Optional[str] = None
     discovered_agents: list[DiscoveredAgent] = field(default_factory=list)
     issues: list[str] = field(default_factory=list)
     actions_taken: list[str] = field(default_factory=list)
@@ -47,56 +72,112 @@ class AuditResult:
         return self.has_agents_dir and self.agents_md_valid
 
 
-def parse_agent_file(file_path: Path) -> Optional[DiscoveredAgent]:
+def _bullet_path(line: str) -> str:
+    """Return the path in a stripped bullet line such as "- `src/api/`"."""
+    i, j = 0, len(line)
+    while i < j and line[i] in "-* \t":
+        i += 1
+    while i < j and line[i] == "`":
+        i += 1
+    while j > i and line[j - 1] in "` \t":
+        j -= 1
+    return line[i:j]
+
+
+def _ownership_header(line_lower: str) -> Optional[str]:
+    """
+    Return which list a stripped, lowercased line introduces: "owns", "never" or None.
+
+    Only ":" and whitespace may follow the keyword, so prose that merely
+    mentions it ("You NEVER touch files outside your domain.") is not a header.
+    """
+    tail = line_lower.rstrip(": \t")
+    if tail.endswith("files i own"):
+        return "owns"
+    if tail.endswith("never touch"):
+        return "never"
+    return None
+
+
+def _extract_ownership(content: str) -> tuple[list[str], list[str]]:
+    """
+    Collect the "Files I OWN" and "Files I NEVER touch" bullet lists in one pass.
+
+    Returns (owns, never_touches). Only the first header of each kind that is
+    followed by a bullet list counts.
+    """
+    lists: dict[str, list[str]] = {"owns": [], "never": []}
+    found = set()
+    current = None
+    started = False
+
+    for line in content.splitlines():
+        line = line.strip()
+
+        if current is not None:
+            if not line:
+                # Blank lines may separate the header from its list, not split it
+                if started:
+                    current = None
+                continue
+            if len(line) > 1 and line[0] in "-*" and line[1].isspace():
+                started = True
+                found.add(current)
+                path = _bullet_path(line)
+                if path:
+                    lists[current].append(path)
+                continue
+            current = None
+
+        kind = _ownership_header(line.lower())
+        if kind and kind not in found:
+            current = kind
+            started = False
+
+    return lists["owns"], lists["never"]
+
+
+def parse_agent_file(file_path: str | Path) -> Optional[DiscoveredAgent]:
     """Parse an agent definition file and extract metadata."""
     try:
-        content = file_path.read_text()
+        with open(file_path, "rb") as f:
+            raw = f.read()
     except Exception:
         return None
 
-    # Parse YAML frontmatter
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if not match:
+    # Locate the YAML frontmatter on raw bytes so non-agent files are never decoded.
+    # The opening fence is "---" plus optional trailing blanks.
+    if not raw.startswith(b"---"):
+        return None
+    start = raw.find(b"\n", 3)
+    if start < 0 or raw[3:start].strip():
         return None
+    end = raw.find(b"\n---", start + 1)
+    if end < 0:
+        return None
+
+    frontmatter = raw[start + 1:end].decode("utf-8", errors="replace")
+    body = raw[end + 4:].decode("utf-8", errors="replace")
 
-    frontmatter = match.group(1)
     name = ""
     description = ""
 
-    for line in frontmatter.split("\n"):
+    for line in frontmatter.splitlines():
         line = line.strip()
         if line.startswith("name:"):
             name = line.split(":", 1)[1].strip()
         elif line.startswith("description:"):
             description = line.split(":", 1)[1].strip()
 
+    # Only materialize a Path once the file turned out to be an agent
+    file_path = Path(file_path)
+
     if not name:
         # Use filename as fallback
         name = file_path.stem
 
-    # Try to extract ownership from content
-    owns = []
-    never_touches = []
-
-    # Look for "Files I OWN" section
-    owns_match = re.search(r'Files I OWN[:\s]*\n((?:[-*]\s+.+\n?)+)', content, re.IGNORECASE)
-    if owns_match:
-        for line in owns_match.group(1).split("\n"):
-            line = line.strip()
-            if line.startswith(("-", "*")):
-                path = line.lstrip("-* ").strip("`")
-                if path:
-                    owns.append(path)
-
-    # Look for "Files I NEVER touch" section
-    never_match = re.search(r'NEVER touch[:\s]*\n((?:[-*]\s+.+\n?)+)', content, re.IGNORECASE)
-    if never_match:
-        for line in never_match.group(1).split("\n"):
-            line = line.strip()
-            if line.startswith(("-", "*")):
-                path = line.lstrip("-* ").strip("`")
-                if path:
-                    never_touches.append(path)
+    # Try to extract ownership from the "Files I OWN" / "Files I NEVER touch" sections
+    owns, never_touches = _extract_ownership(body)
 
     return DiscoveredAgent(
         name=name,
@@ -107,23 +188,106 @@ def parse_agent_file(file_path: Path) -> Optional[DiscoveredAgent]:
     )
 
 
-def validate_agents_md(content: str) -> tuple[bool, list[str]]:
+def _cache_file(project_path: Path) -> Path:
+    """Return the cache file for a project, named after a hash of its absolute path."""
+    digest = hashlib.sha256(os.path.abspath(project_path).encode()).hexdigest()[:16]
+    return AUDIT_CACHE_DIR / f"{digest}.json"
+
+
+def _load_cache(project_path: Path) -> dict:
+    """Load cached agent parses for a project, or an empty cache."""
+    try:
+        data = json.loads(_cache_file(project_path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != AUDIT_CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def _save_cache(project_path: Path, files: dict) -> None:
+    """Persist agent parses; the cache is best-effort, so failures are ignored."""
+    try:
+        AUDIT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_file(project_path).write_text(
+            json.dumps({"version": AUDIT_CACHE_VERSION, "files": files})
+        )
+    except OSError:
+        pass
+
+
+def _parse_cached(
+    entry: os.DirEntry, disk_cache: dict, cache: Optional[dict] = None
+) -> tuple[Optional[DiscoveredAgent], Optional[dict]]:
+    """
+    Parse a scanned agent file unless a cache holds a parse of the same revision.
+
+    The shared in-memory `cache` (keyed by path) is consulted before the
+    project's `disk_cache` (keyed by file name).
+    Returns (agent, cache_entry). The entry is None if the file can't be stat'ed.
+    """
+    try:
+        st = entry.stat()
+    except OSError:
+        return None, None
+
+    cached_entry = cache.get(entry.path) if cache is not None else None
+    if cached_entry is None:
+        cached_entry = disk_cache.get(entry.name)
+    if (
+        cached_entry
+        and cached_entry.get("mtime_ns") == st.st_mtime_ns
+        and cached_entry.get("size") == st.st_size
+    ):
+        cached = cached_entry.get("agent")
+        if cached is None:
+            return None, cached_entry
+        return DiscoveredAgent(file_path=Path(entry.path), **cached), cached_entry
+
+    agent = parse_agent_file(entry.path)
+    return agent, {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "agent": None if agent is None else {
+            "name": agent.name,
+            "description": agent.description,
+            "owns": agent.owns,
+            "never_touches": agent.never_touches,
+        },
+    }
+
+
+def _write_file(path: Path, text: str) -> None:
+    """Write `text` to `path` with one unbuffered write, replacing it atomically."""
+    data = text.encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def validate_agents_md(content: str, content_lower: Optional[str] = None) -> tuple[bool, list[str]]:
     """
     Validate AGENTS.md has required structure.
 
+    Callers that already hold a lowercased copy can pass it as `content_lower`.
+
     Returns (is_valid, list_of_issues)
     """
     issues = []
 
-    # Check for required sections
-    required_sections = [
-        ("Agent Registry", r"Agent Registry|## Agents"),
-        ("Ownership Matrix", r"Ownership Matrix"),
-        ("Routing Table", r"Routing Table"),
-    ]
+    # Check for required sections (case-insensitive) in one lowered copy
+    if content_lower is None:
+        content_lower = content.lower()
 
-    for section_name, pattern in required_sections:
-        if not re.search(pattern, content, re.IGNORECASE):
+    for section_name, needles in REQUIRED_SECTIONS:
+        if not any(needle in content_lower for needle in needles):
             issues.append(f"Missing section: {section_name}")
 
     return len(issues) == 0, issues
@@ -131,28 +295,26 @@ def validate_agents_md(content: str) -> tuple[bool, list[str]]:
 
 def generate_agents_md(agents: list[DiscoveredAgent], project_name: str = "Project") -> str:
     """Generate a framework-compatible AGENTS.md from discovered agents."""
+    # Fill all three tables in one pass over the agents
+    registry = io.StringIO()
+    ownership = io.StringIO()
+    routing = io.StringIO()
 
-    # Build agent registry table
-    registry_rows = []
-    for agent in agents:
-        registry_rows.append(
-            f"| {agent.name} | `{agent.file_path.name}` | {agent.description[:50]}... |"
-        )
-
-    # Build ownership matrix
-    ownership_rows = []
     for agent in agents:
+        name = agent.name
+        description = agent.description
         owns = ", ".join(f"`{p}`" for p in agent.owns[:3]) or "TBD"
         never = ", ".join(f"`{p}`" for p in agent.never_touches[:3]) or "TBD"
-        ownership_rows.append(f"| `{agent.name}` | {owns} | {never} |")
+        trigger = description[:30] if description else name
 
-    # Build routing table
-    routing_rows = []
-    for agent in agents:
-        trigger = agent.description[:30] if agent.description else agent.name
-        routing_rows.append(f"| {trigger} | `{agent.name}` |")
+        registry.write(f"| {name} | `{agent.file_path.name}` | {description[:50]}... |\n")
+        ownership.write(f"| `{name}` | {owns} | {never} |\n")
+        routing.write(f"| {trigger} | `{name}` |\n")
 
-    return f'''# {project_name} Agent System
+    buf = io.StringIO()
+    write = buf.write
+
+    write(f"""# {project_name} Agent System
 
 This document is the **single source of truth** for agent coordination.
 
@@ -162,8 +324,11 @@ This document is the **single source of truth** for agent coordination.
 
 | Agent | File | Purpose |
 |-------|------|---------|
-{chr(10).join(registry_rows)}
+""")
+
+    write(registry.getvalue())
 
+    write("""
 ---
 
 ## Ownership Matrix
@@ -172,16 +337,22 @@ This document is the **single source of truth** for agent coordination.
 
 | Agent | OWNS (only they modify) | NEVER touches |
 |-------|-------------------------|---------------|
-{chr(10).join(ownership_rows)}
+""")
 
+    write(ownership.getvalue())
+
+    write("""
 ---
 
 ## Routing Table
 
 | IF task involves... | SPAWN this agent |
 |---------------------|------------------|
-{chr(10).join(routing_rows)}
+""")
+
+    write(routing.getvalue())
 
+    write("""
 ---
 
 ## Dependency Graph
@@ -199,16 +370,25 @@ finalize (ALWAYS last)
 
 This AGENTS.md was auto-generated by the orchestrator.
 Review and customize the ownership matrix and routing table.
-'''
+""")
+
+    return buf.getvalue()
 
 
-def audit_project(project_path: Path, auto_fix: bool = True) -> AuditResult:
+def audit_project(
+    project_path: Path,
+    auto_fix: bool = True,
+    executor: Optional[ThreadPoolExecutor] = None,
+    cache: Optional[dict] = None,
+) -> AuditResult:
     """
     Audit a target project for orchestration compatibility.
 
     Args:
         project_path: Path to the target project
         auto_fix: If True, create/fix missing files
+        executor: Thread pool to parse agent files on (default: a private one)
+        cache: In-memory parse cache shared across audits; updated in place
 
     Returns:
         AuditResult with findings and actions taken
@@ -227,18 +407,45 @@ def audit_project(project_path: Path, auto_fix: bool = True) -> AuditResult:
 
     # Discover agents
     if result.has_agents_dir:
-        for agent_file in agents_dir.glob("*.md"):
-            if agent_file.name == "AGENTS.md":
-                continue
+        # One readdir yields names and file types without per-file Path objects
+        with os.scandir(agents_dir) as it:
+            agent_files = [
+                entry for entry in it
+                if entry.name not in SKIP_AGENT_FILES
+                and entry.name.endswith(".md")
+                and entry.is_file()
+            ]
+
+        disk_cache = _load_cache(project_path)
+        fresh_cache = {}
+
+        # Parsing is dominated by file reads, so overlap them across threads
+        if agent_files:
+            parse = partial(_parse_cached, disk_cache=disk_cache, cache=cache)
+            if executor is None:
+                with ThreadPoolExecutor(max_workers=min(MAX_AUDIT_WORKERS, len(agent_files))) as pool:
+                    parsed = list(pool.map(parse, agent_files))
+            else:
+                parsed = list(executor.map(parse, agent_files))
 
-            agent = parse_agent_file(agent_file)
-            if agent:
-                result.discovered_agents.append(agent)
+            for agent_file, (agent, entry) in zip(agent_files, parsed):
+                if entry is not None:
+                    fresh_cache[agent_file.name] = entry
+                    if cache is not None:
+                        cache[agent_file.path] = entry
+                if agent:
+                    result.discovered_agents.append(agent)
+
+        # Rewriting only on change also drops entries for deleted files
+        if fresh_cache != disk_cache:
+            _save_cache(project_path, fresh_cache)
 
     # Validate AGENTS.md if exists
     if result.has_agents_md:
         content = agents_md.read_text()
-        result.agents_md_valid, issues = validate_agents_md(content)
+        content_lower = content.lower()
+        result.agents_md_content = content
+        result.agents_md_valid, issues = validate_agents_md(content, content_lower)
         result.issues.extend(issues)
     else:
         result.issues.append("AGENTS.md not found")
@@ -256,9 +463,12 @@ def audit_project(project_path: Path, auto_fix: bool = True) -> AuditResult:
             result.actions_taken.append("Created .claude/agents/ directory")
             result.has_agents_dir = True
 
-        if not tasks_dir.exists():
-            tasks_dir.mkdir(parents=True, exist_ok=True)
+        # mkdir reports whether the directory was new, so skip a separate exists()
+        try:
+            tasks_dir.mkdir(parents=True)
             result.actions_taken.append("Created .claude/tasks/ directory")
+        except FileExistsError:
+            pass
 
         # Create or fix AGENTS.md
         if not result.has_agents_md or not result.agents_md_valid:
@@ -266,26 +476,44 @@ def audit_project(project_path: Path, auto_fix: bool = True) -> AuditResult:
                 # Generate from discovered agents
                 project_name = project_path.name.replace("-", " ").title()
                 content = generate_agents_md(result.discovered_agents, project_name)
-                agents_md.write_text(content)
+                _write_file(agents_md, content)
                 result.actions_taken.append(
                     f"Generated AGENTS.md from {len(result.discovered_agents)} discovered agents"
                 )
             else:
                 # Create minimal template
                 content = generate_minimal_agents_md(project_path.name)
-                agents_md.write_text(content)
+                _write_file(agents_md, content)
                 result.actions_taken.append("Created minimal AGENTS.md template")
 
             result.has_agents_md = True
             result.agents_md_valid = True
+            result.agents_md_content = content
             result.issues = [i for i in result.issues if "AGENTS.md" not in i]
 
     return result
 
 
-def generate_minimal_agents_md(project_name: str) -> str:
-    """Generate a minimal AGENTS.md template for projects with no agents."""
-    return f'''# {project_name} Agent System
+def audit_projects_batch(
+    project_paths: list[Path],
+    auto_fix: bool = True,
+    max_workers: int = MAX_AUDIT_WORKERS,
+) -> list[AuditResult]:
+    """
+    Audit several projects, sharing one thread pool and parse cache between them.
+
+    Returns one AuditResult per project, in the order given.
+    """
+    cache: dict = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [
+            audit_project(project_path, auto_fix=auto_fix, executor=executor, cache=cache)
+            for project_path in project_paths
+        ]
+
+
+# Only the project name varies between minimal AGENTS.md files
+MINIMAL_AGENTS_MD_TEMPLATE = """# {project_name} Agent System
 
 This document is the **single source of truth** for agent coordination.
 
@@ -340,7 +568,12 @@ This document is the **single source of truth** for agent coordination.
 ## Notes
 
 This is a minimal template. Add domain-specific agents for your project.
-'''
+"""
+
+
+def generate_minimal_agents_md(project_name: str) -> str:
+    """Generate a minimal AGENTS.md template for projects with no agents."""
+    return MINIMAL_AGENTS_MD_TEMPLATE.format(project_name=project_name)
 
 
 def print_audit_report(result: AuditResult) -> None:
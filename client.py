@@ -4,10 +4,14 @@ Claude SDK Client Configuration
 Minimal client setup for orchestration mode.
 """
 
+from __future__ import annotations
+
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeSDKClient
 
 
 # Session MCP tools
@@ -24,6 +28,8 @@ BUILTIN_TOOLS = ["Read", "Write", "Edit", "Glob", "Grep", "Bash"]
 
 def create_client(project: Path, model: str) -> ClaudeSDKClient:
     """Create a Claude SDK client configured for orchestration."""
+    # Imported here so that importing this module doesn't pay for the SDK
+    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
     return ClaudeSDKClient(
         options=ClaudeAgentOptions(
@@ -53,6 +59,7 @@ def create_client(project: Path, model: str) -> ClaudeSDKClient:
 
 def create_simple_client(project: Path, model: str) -> ClaudeSDKClient:
     """Create a simple Claude client for one-shot queries (no tools needed)."""
+    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
     return ClaudeSDKClient(
         options=ClaudeAgentOptions(
@@ -14,10 +14,14 @@ Usage:
 
 import argparse
 import asyncio
+import io
 import os
 import re
+import sys
 import time
+import traceback
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
@@ -26,6 +30,7 @@ from client import create_client, create_simple_client
 
 # Configuration
 AUTO_CONTINUE_DELAY = 3
+STREAM_FLUSH_INTERVAL = 0.05  # seconds between stdout flushes while streaming
 DEFAULT_MODEL = "claude-opus-4-5-20251101"
 
 # Progress bar characters
@@ -33,6 +38,14 @@ BAR_FILLED = "█"
 BAR_EMPTY = "░"
 BAR_WIDTH = 30
 
+# Every possible bar, indexed by the number of filled cells
+_BARS = tuple(BAR_FILLED * i + BAR_EMPTY * (BAR_WIDTH - i) for i in range(BAR_WIDTH + 1))
+
+# Patterns used when parsing session files
+_PHASE_LINE_RE = re.compile(r'^[^\S\n]*(\d+)\. \[([x ])\] (\S+) - (.*?\S)[^\S\n]*$', re.MULTILINE)
+_PHASE_STATE_RE = re.compile(r'\d+\. \[([x ])\]')
+_SESSION_NAME_RE = re.compile(r'^# Session: (.+)$', re.MULTILINE)
+
 
 @dataclass
 class PhaseStats:
@@ -122,44 +135,78 @@ def get_session_path(project: Path) -> Path:
 
 def parse_phases(content: str) -> list[dict]:
     """Parse phases from session content."""
-    phases = []
-    for line in content.split('\n'):
-        m = re.match(r'(\d+)\. \[([x ])\] (\S+) - (.+)', line.strip())
-        if m:
-            phases.append({
-                "number": int(m.group(1)),
-                "complete": m.group(2) == 'x',
-                "agent": m.group(3),
-                "description": m.group(4),
-            })
-    return phases
+    return [
+        {
+            "number": int(m[1]),
+            "complete": m[2] == 'x',
+            "agent": m[3],
+            "description": m[4],
+        }
+        for m in _PHASE_LINE_RE.finditer(content)
+    ]
 
 
-def is_session_complete(project: Path) -> bool:
-    """Check if session is complete by parsing session file."""
+@dataclass
+class SessionSnapshot:
+    """Parsed view of the session file at one revision."""
+    name: str
+    phases: list[dict]
+    complete: bool
+
+
+# Parsed session files, keyed by path and validated by (mtime, size)
+_session_cache: dict[Path, tuple[tuple[int, int], SessionSnapshot]] = {}
+
+
+def _all_phases_checked(content: str) -> bool:
+    """True if the content has phase checkboxes and every one is ticked."""
+    checked = False
+    for m in _PHASE_STATE_RE.finditer(content):
+        if m[1] != 'x':
+            return False
+        checked = True
+    return checked
+
+
+def load_session(project: Path) -> Optional[SessionSnapshot]:
+    """Load the parsed session file, re-reading it only when it has changed."""
     session_file = get_session_path(project)
-    if not session_file.exists():
-        return False
+    try:
+        st = session_file.stat()
+    except FileNotFoundError:
+        _session_cache.pop(session_file, None)
+        return None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _session_cache.get(session_file)
+    if cached and cached[0] == key:
+        return cached[1]
 
     content = session_file.read_text()
 
-    if "State: complete" in content:
-        return True
+    name_match = _SESSION_NAME_RE.search(content)
+    session = SessionSnapshot(
+        name=name_match.group(1) if name_match else "Unknown",
+        phases=parse_phases(content),
+        complete="State: complete" in content or _all_phases_checked(content),
+    )
+    _session_cache[session_file] = (key, session)
+    return session
 
-    phases = re.findall(r'\d+\. \[([x ])\]', content)
-    return phases and all(p == 'x' for p in phases)
+
+def is_session_complete(project: Path) -> bool:
+    """Check if session is complete by parsing session file."""
+    session = load_session(project)
+    return session is not None and session.complete
 
 
 def get_current_phase(project: Path) -> Optional[dict]:
     """Get the current (first incomplete) phase."""
-    session_file = get_session_path(project)
-    if not session_file.exists():
+    session = load_session(project)
+    if session is None:
         return None
 
-    content = session_file.read_text()
-    phases = parse_phases(content)
-
-    for phase in phases:
+    for phase in session.phases:
         if not phase["complete"]:
             return phase
     return None
@@ -167,19 +214,15 @@ def get_current_phase(project: Path) -> Optional[dict]:
 
 def print_progress_bar(project: Path, stats: Optional[SessionStats] = None) -> None:
     """Print a visual progress bar with phase information."""
-    session_file = get_session_path(project)
-    if not session_file.exists():
+    session = load_session(project)
+    if session is None:
         print("   No session file")
         return
 
-    content = session_file.read_text()
-
-    # Get session name
-    name_match = re.search(r'^# Session: (.+)$', content, re.MULTILINE)
-    name = name_match.group(1) if name_match else "Unknown"
+    name = session.name
 
     # Parse phases
-    phases = parse_phases(content)
+    phases = session.phases
     if not phases:
         print("   No phases found")
         return
@@ -189,19 +232,22 @@ def print_progress_bar(project: Path, stats: Optional[SessionStats] = None) -> N
     progress = completed / total if total > 0 else 0
 
     # Build progress bar
-    filled = int(BAR_WIDTH * progress)
-    bar = BAR_FILLED * filled + BAR_EMPTY * (BAR_WIDTH - filled)
+    bar = _BARS[int(BAR_WIDTH * progress)]
 
     print(f"\n   Session: {name}")
     print(f"   [{bar}] {completed}/{total} phases ({progress * 100:.0f}%)")
 
+    # The current phase is the first incomplete one
+    current = next((p for p in phases if not p["complete"]), None)
+    current_num = current["number"] if current else None
+
     # Show phase list with status
     print("\n   Phases:")
     for phase in phases:
         if phase["complete"]:
             status = "✓"
             color = "\033[32m"  # Green
-        elif get_current_phase(project) and phase["number"] == get_current_phase(project)["number"]:
+        elif phase["number"] == current_num:
             status = "▶"
             color = "\033[33m"  # Yellow
         else:
@@ -223,6 +269,22 @@ def print_progress_bar(project: Path, stats: Optional[SessionStats] = None) -> N
         print(f"   {color}{status} {phase['number']}. {phase['agent']}: {phase['description']}{extra}{reset}")
 
 
+def session_progress_key(project: Path) -> Optional[tuple[int, Optional[int]]]:
+    """Return (completed phases, current phase number), which changes whenever the status display would."""
+    session = load_session(project)
+    if session is None:
+        return None
+
+    completed = 0
+    current_num = None
+    for phase in session.phases:
+        if phase["complete"]:
+            completed += 1
+        elif current_num is None:
+            current_num = phase["number"]
+    return completed, current_num
+
+
 def print_session_status(project: Path, stats: Optional[SessionStats] = None) -> None:
     """Print current session status with progress bar."""
     print_progress_bar(project, stats)
@@ -248,76 +310,206 @@ def print_stats_summary(stats: SessionStats) -> None:
 
     if stats.phases:
         print("\n   Per-phase breakdown:")
-        for phase_num in sorted(stats.phases.keys()):
-            phase = stats.phases[phase_num]
+        # Phases are started in order, so insertion order is already sorted
+        for phase in stats.phases.values():
             if phase.completed:
-                duration = stats.get_phase_duration(phase_num) or 0
+                duration = stats.get_phase_duration(phase.phase_number) or 0
                 tokens = phase.input_tokens + phase.output_tokens
-                print(f"     {phase_num}. {phase.agent}: {format_duration(duration)}, {format_tokens(tokens)} tokens")
+                print(f"     {phase.phase_number}. {phase.agent}: {format_duration(duration)}, {format_tokens(tokens)} tokens")
+
+
+# Built context strings, keyed by name and validated by a stat signature
+_context_cache: dict[str, tuple[tuple, str]] = {}
+
+
+def _stat_key(path: Path) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) for a path, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
-def load_core_context() -> str:
-    """Load core framework agents and skills for context injection."""
+def _read_small_file(path: Path) -> str:
+    """Read a small UTF-8 file with one unbuffered read sized from fstat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            # Size is a hint; keep reading in case the file grew since fstat
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+def _scan_skills(skills_dir: Path) -> list[tuple[str, Path, os.stat_result]]:
+    """List (name, SKILL.md path, stat) for each skill directory, sorted by name."""
+    try:
+        with os.scandir(skills_dir) as it:
+            skill_dirs = sorted((entry for entry in it if entry.is_dir()), key=lambda e: e.name)
+    except FileNotFoundError:
+        return []
+
+    skills = []
+    for entry in skill_dirs:
+        skill_file = os.path.join(entry.path, "SKILL.md")
+        try:
+            skills.append((entry.name, Path(skill_file), os.stat(skill_file)))
+        except FileNotFoundError:
+            continue
+    return skills
+
+
+def _core_context_sources() -> tuple[tuple, Optional[Path], Optional[list[tuple[str, Path]]]]:
+    """
+    Stat the files that make up the core context.
+
+    Returns (signature, AGENTS.md path or None, [(skill name, SKILL.md path)] or None).
+    """
     orchestrator_dir = Path(__file__).parent
-    context_parts = []
+    core_agents_md = orchestrator_dir / ".claude" / "agents" / "AGENTS.md"
+    skills_dir = orchestrator_dir / ".claude" / "skills"
+
+    skill_files = _scan_skills(skills_dir)
+
+    # Skills rarely change mid-run, so stat them rather than re-reading each one
+    signature = (
+        _stat_key(core_agents_md),
+        skills_dir.exists(),
+        tuple((name, st.st_mtime_ns, st.st_size) for name, _, st in skill_files),
+    )
+    return (
+        signature,
+        core_agents_md if signature[0] is not None else None,
+        [(name, skill_file) for name, skill_file, _ in skill_files] if signature[1] else None,
+    )
+
+
+def _build_core_context(signature: tuple, agents_md_text: Optional[str], skills: Optional[list[tuple[str, str]]]) -> str:
+    """Assemble (and cache) the core context from already-read file contents."""
+    buf = io.StringIO()
+    write = buf.write
 
     # Load core AGENTS.md
-    core_agents_md = orchestrator_dir / ".claude" / "agents" / "AGENTS.md"
-    if core_agents_md.exists():
-        context_parts.append("## Core Framework Agents\n\n")
-        context_parts.append(core_agents_md.read_text())
+    if agents_md_text is not None:
+        write("## Core Framework Agents\n\n")
+        write(agents_md_text)
 
     # Load ALL orchestrator skills fully - these are the orchestrator's operating manual
-    skills_dir = orchestrator_dir / ".claude" / "skills"
+    if skills is not None:
+        write(
+            "\n\n## Orchestrator Skills\n"
+            "These skills define HOW to orchestrate. Read and follow them.\n"
+        )
+        for name, text in skills:
+            write(f"\n### Skill: {name}\n")
+            write(text)
 
-    if skills_dir.exists():
-        context_parts.append("\n\n## Orchestrator Skills\n")
-        context_parts.append("These skills define HOW to orchestrate. Read and follow them.\n")
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if skill_dir.is_dir():
-                skill_file = skill_dir / "SKILL.md"
-                if skill_file.exists():
-                    context_parts.append(f"\n### Skill: {skill_dir.name}\n")
-                    context_parts.append(skill_file.read_text())
+    context = buf.getvalue()
+    _context_cache["core"] = (signature, context)
+    return context
 
-    return "".join(context_parts)
+
+async def aload_core_context() -> str:
+    """
+    Load core framework agents and skills for context injection.
+
+    The files are read concurrently in worker threads, and only when one changed.
+    """
+    signature, agents_md, skills = await asyncio.to_thread(_core_context_sources)
+    cached = _context_cache.get("core")
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    paths = ([agents_md] if agents_md else []) + [path for _, path in skills or ()]
+    texts = await asyncio.gather(*(asyncio.to_thread(_read_small_file, path) for path in paths))
+
+    agents_md_text = texts.pop(0) if agents_md else None
+    return _build_core_context(
+        signature,
+        agents_md_text,
+        [(name, text) for (name, _), text in zip(skills, texts)] if skills is not None else None,
+    )
 
 
 def load_project_context(project: Path, audit_result) -> str:
     """Load target project agents and skills for context injection."""
-    context_parts = []
+    # Discover target project skills (list only - agents read full content themselves)
+    skills_dir = project / ".claude" / "skills"
+    skill_names = [name for name, _, _ in _scan_skills(skills_dir)]
+
+    # Everything else comes from the audit, so the same audit yields the same text
+    signature = (audit_result, tuple(skill_names))
+    cached = _context_cache.get(str(project))
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    buf = io.StringIO()
+    write = buf.write
 
-    # Load project AGENTS.md if exists
-    project_agents_md = project / ".claude" / "agents" / "AGENTS.md"
-    if project_agents_md.exists():
-        context_parts.append("\n\n## Target Project Agents\n\n")
-        context_parts.append(project_agents_md.read_text())
+    # Load project AGENTS.md if exists (already read by the audit)
+    if audit_result.agents_md_content is not None:
+        write("\n\n## Target Project Agents\n\n")
+        write(audit_result.agents_md_content)
 
     # List discovered agents
     if audit_result.discovered_agents:
-        context_parts.append("\n\n## Discovered Domain Agents\n")
+        write("\n\n## Discovered Domain Agents\n")
         for agent in audit_result.discovered_agents:
-            context_parts.append(f"\n### Agent: {agent.name}\n")
-            context_parts.append(f"Description: {agent.description}\n")
-            context_parts.append(f"File: {agent.file_path}\n")
+            write(
+                f"\n### Agent: {agent.name}\n"
+                f"Description: {agent.description}\n"
+                f"File: {agent.file_path}\n"
+            )
             if agent.owns:
-                context_parts.append(f"Owns: {', '.join(agent.owns)}\n")
+                write(f"Owns: {', '.join(agent.owns)}\n")
 
-    # Discover target project skills (list only - agents read full content themselves)
-    skills_dir = project / ".claude" / "skills"
-    if skills_dir.exists():
-        skill_names = []
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
-                skill_names.append(skill_dir.name)
+    if skill_names:
+        write(
+            "\n\n## Target Project Skills\n"
+            "Domain-specific skills available in `.claude/skills/`:\n"
+        )
+        for name in skill_names:
+            write(f"- `{name}` - see `.claude/skills/{name}/SKILL.md`\n")
+
+    context = buf.getvalue()
+    _context_cache[str(project)] = (signature, context)
+    return context
+
+
+@cache
+def _get_sdk():
+    """Import claude_agent_sdk on first use, so commands like `status` never load it."""
+    import claude_agent_sdk
+    return claude_agent_sdk
 
-        if skill_names:
-            context_parts.append("\n\n## Target Project Skills\n")
-            context_parts.append("Domain-specific skills available in `.claude/skills/`:\n")
-            for name in skill_names:
-                context_parts.append(f"- `{name}` - see `.claude/skills/{name}/SKILL.md`\n")
 
-    return "".join(context_parts)
+class _NameMatch(type):
+    """Stand-in for an SDK type whose isinstance check compares class names."""
+
+    def __instancecheck__(cls, obj) -> bool:
+        return type(obj).__name__ == cls.__name__
+
+
+@cache
+def _message_types() -> tuple[type, type, type, type, type]:
+    """
+    Return (AssistantMessage, ResultMessage, TextBlock, ToolUseBlock, UserMessage).
+
+    If the SDK can't be imported, the types fall back to class-name checks.
+    """
+    names = ("AssistantMessage", "ResultMessage", "TextBlock", "ToolUseBlock", "UserMessage")
+    try:
+        sdk = _get_sdk()
+    except ImportError:
+        return tuple(_NameMatch(name, (), {}) for name in names)
+    return tuple(getattr(sdk, name) for name in names)
 
 
 @dataclass
@@ -339,11 +531,28 @@ async def run_planning_session(
     print("  Creating session plan...")
     print("-" * 60 + "\n")
 
-    # Build planning prompt
-    core_context = load_core_context()
-    project_context = load_project_context(project, audit_result)
+    client = create_client(project, model)
+
+    # Read the context files while the client connects. The client must connect,
+    # query and disconnect in this task, so only the loads run as separate tasks.
+    core_task = asyncio.create_task(aload_core_context())
+    project_task = asyncio.create_task(asyncio.to_thread(load_project_context, project, audit_result))
+
+    try:
+        await client.connect()
+        core_context, project_context = await asyncio.gather(core_task, project_task)
+
+        await run_session(client, _planning_prompt(project, user_request, core_context, project_context))
+    finally:
+        # No-ops once the loads finished; stops them if connecting failed
+        core_task.cancel()
+        project_task.cancel()
+        await client.disconnect()
+
 
-    planning_prompt = f"""You are the session-planner agent. Your task is to analyze the user's request and create a session file.
+def _planning_prompt(project: Path, user_request: str, core_context: str, project_context: str) -> str:
+    """Build the prompt for the session-planner agent."""
+    return f"""You are the session-planner agent. Your task is to analyze the user's request and create a session file.
 
 {core_context}
 
@@ -390,33 +599,47 @@ Do NOT use phase headers like `### Phase 1:` or nested task lists.
 Begin by reading your agent definition.
 """
 
-    client = create_client(project, model)
-
-    async with client:
-        await run_session(client, planning_prompt)
-
 
 async def run_session(client, prompt: str) -> SessionResult:
     """Run a single orchestration session and return results with token counts."""
+    AssistantMessage, ResultMessage, TextBlock, ToolUseBlock, _ = _message_types()
+
     await client.query(prompt)
 
     result = SessionResult()
 
+    # Flush on newlines or every STREAM_FLUSH_INTERVAL rather than once per block
+    write = sys.stdout.write
+    last_flush = time.monotonic()
+
     async for msg in client.receive_response():
-        if type(msg).__name__ == "AssistantMessage" and hasattr(msg, "content"):
+        if isinstance(msg, AssistantMessage):
             for block in msg.content:
-                if type(block).__name__ == "TextBlock" and hasattr(block, "text"):
+                if isinstance(block, TextBlock):
                     result.response += block.text
-                    print(block.text, end="", flush=True)
-                elif type(block).__name__ == "ToolUseBlock" and hasattr(block, "name"):
-                    print(f"\n[Tool: {block.name}]", flush=True)
-
-        # Try to extract token usage from the message
-        if hasattr(msg, "usage"):
-            if hasattr(msg.usage, "input_tokens"):
-                result.input_tokens += msg.usage.input_tokens
-            if hasattr(msg.usage, "output_tokens"):
-                result.output_tokens += msg.usage.output_tokens
+                    write(block.text)
+                    newline = "\n" in block.text
+                elif isinstance(block, ToolUseBlock):
+                    write(f"\n[Tool: {block.name}]\n")
+                    newline = True
+                else:
+                    continue
+
+                now = time.monotonic()
+                if newline or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                    sys.stdout.flush()
+                    last_flush = now
+
+        elif isinstance(msg, ResultMessage) and msg.usage:
+            # The result carries the turn's total usage (as a dict); assistant
+            # messages repeat per-API-call usage, so only this one is counted
+            usage = msg.usage
+            if isinstance(usage, dict):
+                result.input_tokens += usage.get("input_tokens", 0)
+                result.output_tokens += usage.get("output_tokens", 0)
+            else:
+                result.input_tokens += getattr(usage, "input_tokens", 0)
+                result.output_tokens += getattr(usage, "output_tokens", 0)
 
     print("\n" + "-" * 60)
     return result
@@ -430,21 +653,21 @@ def archive_session(project: Path) -> None:
 
     tasks_dir = session_path.parent
 
-    # Find next available session number
-    existing = list(tasks_dir.glob("session-*.md"))
+    # Find next available session number in one pass over the directory
     max_num = 0
-    for f in existing:
-        if f.name == "session-current.md":
-            continue
-        try:
-            num = int(f.stem.split("-")[1])
-            max_num = max(max_num, num)
-        except (IndexError, ValueError):
-            pass
+    with os.scandir(tasks_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not (name.startswith("session-") and name.endswith(".md")):
+                continue
+            num = name[8:-3]
+            if num.isdecimal():
+                max_num = max(max_num, int(num))
 
     new_name = f"session-{max_num + 1}.md"
     new_path = tasks_dir / new_name
     session_path.rename(new_path)
+    _session_cache.pop(session_path, None)
     print(f"  Archived: {session_path.name} → {new_name}")
 
 
@@ -470,21 +693,18 @@ async def run_orchestration(
     print(f"Project: {project}")
     print(f"Model: {model}")
 
-    # Step 1: Check AGENTS.md exists and is valid
-    agents_md_path = project / ".claude" / "agents" / "AGENTS.md"
+    # Step 1: Check AGENTS.md exists and is valid (the audit reads it once)
+    audit_result = audit_project(project, auto_fix=False)
 
-    if not agents_md_path.exists():
+    if not audit_result.has_agents_md:
         print("\n✗ AGENTS.md not found")
         print("\nRun 'init' first to initialize the project:")
         print(f"  ./run.sh init {project}")
         return
 
-    content = agents_md_path.read_text()
-    is_valid, issues = validate_agents_md(content)
-
-    if not is_valid:
+    if not audit_result.agents_md_valid:
         print("\n✗ AGENTS.md is invalid:")
-        for issue in issues:
+        for issue in audit_result.issues:
             print(f"  - {issue}")
         print("\nRun 'init' to regenerate:")
         print(f"  ./run.sh init {project}")
@@ -492,9 +712,7 @@ async def run_orchestration(
 
     print("\n✓ AGENTS.md valid")
 
-    # Step 2: Discover agents for display
-    audit_result = audit_project(project, auto_fix=False)
-
+    # Step 2: Show discovered agents
     if audit_result.discovered_agents:
         print(f"\nAvailable agents ({len(audit_result.discovered_agents)}):")
         for agent in audit_result.discovered_agents:
@@ -554,11 +772,12 @@ async def run_orchestration(
     print(f"Project: {project}")
     print(f"Model: {model}")
     print_session_status(project, stats)
+    last_rendered = session_progress_key(project)
     print()
 
     # Load prompt with core context (skills) and project context
     base_prompt = load_orchestrator_prompt()
-    core_context = load_core_context()
+    core_context = await aload_core_context()
     project_context = load_project_context(project, audit_result)
 
     prompt = f"""# CONTEXT
@@ -572,61 +791,84 @@ async def run_orchestration(
 {base_prompt}
 """
 
-    # Main loop
-    iteration = 0
-    while True:
-        iteration += 1
-
-        if max_iterations and iteration > max_iterations:
-            print(f"\nReached max iterations ({max_iterations})")
-            break
-
-        if is_session_complete(project):
-            print("\n" + "=" * 60)
-            print("  SESSION COMPLETE")
-            print("=" * 60)
-            print_session_status(project, stats)
-            print_stats_summary(stats)
-            break
-
-        # Get current phase for tracking
-        current_phase = get_current_phase(project)
-        if current_phase:
-            stats.start_phase(
-                current_phase["number"],
-                current_phase["agent"],
-                current_phase["description"]
-            )
-
-        print(f"\n--- Iteration {iteration} ---")
-        if current_phase:
-            print(f"    Phase {current_phase['number']}: {current_phase['agent']}")
-        print()
-
-        client = create_client(project, model)
-        iteration_start = time.time()
-
-        async with client:
-            result = await run_session(client, prompt)
-
-        iteration_duration = time.time() - iteration_start
-
-        # Check if phase completed and update stats
-        new_phase = get_current_phase(project)
-        if current_phase and (new_phase is None or new_phase["number"] != current_phase["number"]):
-            # Phase changed, mark previous as complete
-            stats.end_phase(
-                current_phase["number"],
-                input_tokens=result.input_tokens,
-                output_tokens=result.output_tokens
-            )
-            print(f"\n   Phase {current_phase['number']} completed in {format_duration(iteration_duration)}")
-            if result.input_tokens or result.output_tokens:
-                print(f"   Tokens: {format_tokens(result.input_tokens)} in / {format_tokens(result.output_tokens)} out")
-
-        print_session_status(project, stats)
-        print(f"\nContinuing in {AUTO_CONTINUE_DELAY}s...")
-        await asyncio.sleep(AUTO_CONTINUE_DELAY)
+    # Main loop - each iteration runs in a fresh client and conversation. The next
+    # iteration's client is connected during the pause, since starting the CLI and
+    # its MCP server is the slow part of a new conversation.
+    client = None
+    try:
+        iteration = 0
+        while True:
+            iteration += 1
+
+            if max_iterations and iteration > max_iterations:
+                print(f"\nReached max iterations ({max_iterations})")
+                break
+
+            if is_session_complete(project):
+                print("\n" + "=" * 60)
+                print("  SESSION COMPLETE")
+                print("=" * 60)
+                print_session_status(project, stats)
+                print_stats_summary(stats)
+                break
+
+            # Get current phase for tracking
+            current_phase = get_current_phase(project)
+            if current_phase:
+                stats.start_phase(
+                    current_phase["number"],
+                    current_phase["agent"],
+                    current_phase["description"]
+                )
+
+            print(f"\n--- Iteration {iteration} ---")
+            if current_phase:
+                print(f"    Phase {current_phase['number']}: {current_phase['agent']}")
+            print()
+
+            iteration_start = time.time()
+            if client is None:
+                client = create_client(project, model)
+                await client.connect()
+
+            try:
+                result = await run_session(client, prompt)
+            finally:
+                await client.disconnect()
+                client = None
+
+            iteration_duration = time.time() - iteration_start
+
+            # Check if phase completed and update stats
+            new_phase = get_current_phase(project)
+            if current_phase and (new_phase is None or new_phase["number"] != current_phase["number"]):
+                # Phase changed, mark previous as complete
+                stats.end_phase(
+                    current_phase["number"],
+                    input_tokens=result.input_tokens,
+                    output_tokens=result.output_tokens
+                )
+                print(f"\n   Phase {current_phase['number']} completed in {format_duration(iteration_duration)}")
+                if result.input_tokens or result.output_tokens:
+                    print(f"   Tokens: {format_tokens(result.input_tokens)} in / {format_tokens(result.output_tokens)} out")
+
+            # Only re-render when a phase was completed or the current phase moved
+            progress = session_progress_key(project)
+            if progress != last_rendered:
+                print_session_status(project, stats)
+                last_rendered = progress
+            print(f"\nContinuing in {AUTO_CONTINUE_DELAY}s...")
+
+            # Connect the next client while the pause runs (in this task, which
+            # must also be the one that queries and disconnects it)
+            pause = asyncio.create_task(asyncio.sleep(AUTO_CONTINUE_DELAY))
+            if not is_session_complete(project) and not (max_iterations and iteration >= max_iterations):
+                client = create_client(project, model)
+                await client.connect()
+            await pause
+    finally:
+        if client is not None:
+            await client.disconnect()
 
     print_stats_summary(stats)
     print("\nDone!")
@@ -652,8 +894,11 @@ async def init_command(project: Path, model: str) -> None:
             print(f"  Created: {dir_path.relative_to(project)}")
 
     # Step 2: Discover existing agents
-    agent_files = list(agents_dir.glob("*.md"))
-    agent_files = [f for f in agent_files if f.name != "AGENTS.md"]
+    with os.scandir(agents_dir) as it:
+        agent_files = [
+            Path(entry.path) for entry in it
+            if entry.name != "AGENTS.md" and entry.name.endswith(".md") and entry.is_file()
+        ]
 
     print(f"\n  Found {len(agent_files)} agent file(s)")
     for f in agent_files:
@@ -661,13 +906,7 @@ async def init_command(project: Path, model: str) -> None:
 
     # Step 3: Discover skills
     skills_dir = project / ".claude" / "skills"
-    skill_files = []
-    if skills_dir.exists():
-        for item in sorted(skills_dir.iterdir()):
-            if item.is_dir():
-                skill_file = item / "SKILL.md"
-                if skill_file.exists():
-                    skill_files.append((item.name, skill_file))
+    skill_files = [(name, skill_file) for name, skill_file, _ in _scan_skills(skills_dir)]
 
     if skill_files:
         print(f"\n  Found {len(skill_files)} skill(s)")
@@ -758,9 +997,6 @@ CRITICAL: Only include information that is EXPLICITLY stated in the agent files
 Output ONLY the markdown. Start with "# {project.name} Agent System".
 """
 
-    # Use Claude SDK which auto-detects credentials from ~/.claude
-    from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
-
     # Tell Claude to write the file directly using the Write tool
     write_prompt = f"""{prompt}
 
@@ -768,8 +1004,11 @@ IMPORTANT: Use the Write tool to write the AGENTS.md content directly to: {agent
 Do NOT use the Read tool. All the information you need is provided above.
 """
 
-    client = ClaudeSDKClient(
-        options=ClaudeAgentOptions(
+    # Claude SDK auto-detects credentials from ~/.claude
+    sdk = _get_sdk()
+    AssistantMessage, ResultMessage, TextBlock, ToolUseBlock, UserMessage = _message_types()
+    client = sdk.ClaudeSDKClient(
+        options=sdk.ClaudeAgentOptions(
             model=model,
             system_prompt="You generate documentation files. Write files directly using the Write tool.",
             allowed_tools=["Write"],
@@ -784,25 +1023,22 @@ Do NOT use the Read tool. All the information you need is provided above.
 
             step = 0
             async for msg in client.receive_response():
-                msg_type = type(msg).__name__
-
-                if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                if isinstance(msg, AssistantMessage):
                     for block in msg.content:
-                        if hasattr(block, "text") and block.text.strip():
+                        if isinstance(block, TextBlock) and block.text.strip():
                             print(f"\n{block.text}", flush=True)
-                        elif hasattr(block, "name"):
+                        elif isinstance(block, ToolUseBlock):
                             step += 1
                             if block.name == "Write":
                                 print(f"  [{step}] Writing AGENTS.md...", flush=True)
                             else:
                                 print(f"  [{step}] {block.name}...", flush=True)
-                elif msg_type == "UserMessage":
+                elif isinstance(msg, UserMessage):
                     # Tool result - file was written
                     pass
-                elif msg_type == "ResultMessage":
+                elif isinstance(msg, ResultMessage):
                     print("  Done!", flush=True)
     except Exception as e:
-        import traceback
         print(f"\n\nError: {e}")
         print(traceback.format_exc())
         return
@@ -903,9 +1139,12 @@ def status_command(project: Path) -> None:
             print(f"\n   Next: Phase {current['number']} ({current['agent']})")
 
 
-if __name__ == "__main__":
-    import sys
+def project_path(arg: str) -> Path:
+    """Make a CLI project path absolute without resolve()'s per-component symlink stats."""
+    return Path(os.path.abspath(arg))
+
 
+if __name__ == "__main__":
     # Get model from environment or use default
     default_model = os.environ.get("CLAUDE_MODEL", DEFAULT_MODEL)
 
@@ -917,7 +1156,7 @@ if __name__ == "__main__":
             description="Run orchestration on a project",
             formatter_class=argparse.RawDescriptionHelpFormatter,
         )
-        parser.add_argument("project", type=Path, help="Project directory")
+        parser.add_argument("project", type=project_path, help="Project directory")
         parser.add_argument("--model", "-m", type=str, default=default_model, help="Claude model")
         parser.add_argument("--max-iterations", "-n", type=int, default=None, help="Max iterations")
 
@@ -925,7 +1164,7 @@ if __name__ == "__main__":
 
         try:
             asyncio.run(run_orchestration(
-                args.project.resolve(),
+                args.project,
                 args.model,
                 args.max_iterations,
             ))
@@ -949,33 +1188,33 @@ Examples:
 
         # Init subcommand
         init_parser = subparsers.add_parser("init", help="Initialize project (create AGENTS.md)")
-        init_parser.add_argument("project", type=Path, help="Project directory")
+        init_parser.add_argument("project", type=project_path, help="Project directory")
         init_parser.add_argument("--model", "-m", type=str, default=default_model, help="Claude model")
 
         # New session subcommand
         new_parser = subparsers.add_parser("new", help="Start new session (archives existing)")
-        new_parser.add_argument("project", type=Path, help="Project directory")
+        new_parser.add_argument("project", type=project_path, help="Project directory")
         new_parser.add_argument("--model", "-m", type=str, default=default_model, help="Claude model")
         new_parser.add_argument("--max-iterations", "-n", type=int, default=None, help="Max iterations")
 
         # Status subcommand
         status_parser = subparsers.add_parser("status", help="Show session status")
-        status_parser.add_argument("project", type=Path, help="Project directory")
+        status_parser.add_argument("project", type=project_path, help="Project directory")
 
         args = parser.parse_args()
 
         try:
             if args.command == "init":
-                asyncio.run(init_command(args.project.resolve(), args.model))
+                asyncio.run(init_command(args.project, args.model))
             elif args.command == "new":
                 asyncio.run(run_orchestration(
-                    args.project.resolve(),
+                    args.project,
                     args.model,
                     args.max_iterations,
                     new_session=True,
                 ))
             elif args.command == "status":
-                status_command(args.project.resolve())
+                status_command(args.project)
             else:
                 parser.print_help()
         except KeyboardInterrupt:
@@ -6,27 +6,161 @@ Manages orchestration session state via markdown files.
 Provides tools for reading status, getting next phase, and marking completion.
 """
 
+import io
 import json
 import os
-import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 PROJECT_DIR = Path(os.environ.get("PROJECT_DIR", ".")).resolve()
+SESSION_PATH = PROJECT_DIR / ".claude" / "tasks" / "session-current.md"
 
 mcp = FastMCP("session")
 
 
+def _dumps(obj) -> str:
+    """Serialize a tool response as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# "## " sections of a session file
+SESSION_SECTIONS = frozenset({"Status", "User Request", "Phases", "Work Log"})
+
+# Sections the lighter tools need
+_NEXT_PHASE_SECTIONS = frozenset({"User Request", "Phases"})
+_PHASES_ONLY = frozenset({"Phases"})
+
+# Fixed tool responses, serialized once
+_NO_SESSION_JSON = _dumps({"error": "No session file found"})
+_NO_SESSION_HINT_JSON = _dumps({
+    "error": "No session file found",
+    "hint": "Create .claude/tasks/session-current.md"
+})
+_ALL_COMPLETE_JSON = _dumps({
+    "all_complete": True,
+    "message": "All phases complete!"
+})
+
+# Phase checkbox mark, indexed by the phase's "complete" flag
+_CHECKBOX = (' ', 'x')
+
+
 def get_session_path() -> Path:
-    return PROJECT_DIR / ".claude" / "tasks" / "session-current.md"
+    return SESSION_PATH
+
+
+def _parse_phase_line(line: str) -> Optional[dict]:
+    """Parse a stripped "N. [x] agent - description" line, or return None."""
+    num_end = line.find('. [')
+    if num_end <= 0 or not line[:num_end].isdecimal():
+        return None
+
+    # "N. [" then the checkbox mark, then "] "
+    mark = line[num_end + 3:num_end + 4]
+    if mark not in ('x', ' ') or line[num_end + 4:num_end + 6] != '] ':
+        return None
+
+    # The agent is one whitespace-free word, followed by " - " and the description
+    rest = line[num_end + 6:]
+    if not rest or rest[0].isspace():
+        return None
+    agent = rest.split(None, 1)[0]
+    sep = len(agent)
+    if rest[sep:sep + 3] != ' - ' or len(rest) == sep + 3:
+        return None
+
+    return {
+        "number": int(line[:num_end]),
+        "complete": mark == 'x',
+        "agent": agent,
+        "description": rest[sep + 3:],
+    }
+
+
+def _block_lines(body: str, is_item) -> list[str]:
+    """
+    Return the run of item lines at the start of a section body.
+
+    Blank lines before the run are skipped; the run ends at the first line that
+    isn't an item or isn't newline-terminated (the last line of the file).
+    """
+    lines = body.split('\n')
+    i = 0
+    while i < len(lines) - 1 and not lines[i].strip():
+        i += 1
+
+    items = []
+    for line in lines[i:-1]:
+        if not is_item(line):
+            break
+        items.append(line)
+    return items
+
+
+def _is_status_line(line: str) -> bool:
+    return line.startswith('- ') and len(line) > 2
+
+
+def _is_phase_item(line: str) -> bool:
+    dot = line.find('. ')
+    return dot > 0 and line[:dot].isdecimal() and len(line) > dot + 2
+
+
+def _take_while(text: str, pred) -> str:
+    i = 0
+    while i < len(text) and pred(text[i]):
+        i += 1
+    return text[:i]
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
 
 
-def parse_session(content: str) -> dict:
-    """Parse session markdown into structured data."""
+def _parse_status(lines: list[str], result: dict) -> None:
+    """Fill phase, agent and state from "- Key: value" Status lines; the first of each wins."""
+    found = set()
+    for line in lines:
+        if line.startswith('- Phase: ') and 'phase' not in found:
+            current, sep, total = line[9:].partition(' of ')
+            total = _take_while(total, str.isdecimal)
+            if sep and current.isdecimal() and total:
+                result["phase"] = int(current)
+                result["total_phases"] = int(total)
+                found.add('phase')
+
+        elif line.startswith('- Current Agent: ') and 'agent' not in found:
+            agent = line[17:]
+            if agent and not agent[0].isspace():
+                result["current_agent"] = agent.split(None, 1)[0]
+                found.add('agent')
+
+        elif line.startswith('- State: ') and 'state' not in found:
+            state = _take_while(line[9:], _is_word_char)
+            if state:
+                result["state"] = state
+                found.add('state')
+
+
+def parse_session(content: str, wanted: frozenset[str] = SESSION_SECTIONS) -> dict:
+    """
+    Parse session markdown into structured data.
+
+    Only the "## " sections named in `wanted` are decoded; the others keep
+    their empty defaults.
+    """
     result = {
         "name": "",
         "phase": 0,
@@ -38,80 +172,148 @@ def parse_session(content: str) -> dict:
         "work_log": "",
     }
 
-    # Session name
-    match = re.search(r'^# Session: (.+)$', content, re.MULTILINE)
-    if match:
-        result["name"] = match.group(1).strip()
-
-    # Status section
-    match = re.search(r'## Status\s*\n((?:- .+\n)+)', content, re.MULTILINE)
-    if match:
-        status = match.group(1)
-
-        m = re.search(r'Phase: (\d+) of (\d+)', status)
-        if m:
-            result["phase"] = int(m.group(1))
-            result["total_phases"] = int(m.group(2))
-
-        m = re.search(r'Current Agent: (\S+)', status)
-        if m:
-            result["current_agent"] = m.group(1)
-
-        m = re.search(r'State: (\w+)', status)
-        if m:
-            result["state"] = m.group(1)
-
-    # User request
-    match = re.search(r'## User Request\s*\n([\s\S]*?)(?=\n## |\Z)', content)
-    if match:
-        result["user_request"] = match.group(1).strip()
-
-    # Phases
-    match = re.search(r'## Phases\s*\n((?:\d+\. .+\n)+)', content, re.MULTILINE)
-    if match:
-        for line in match.group(1).strip().split('\n'):
-            m = re.match(r'(\d+)\. \[([x ])\] (\S+) - (.+)', line.strip())
-            if m:
-                result["phases"].append({
-                    "number": int(m.group(1)),
-                    "complete": m.group(2) == 'x',
-                    "agent": m.group(3),
-                    "description": m.group(4),
-                })
-
-    # Work log
-    match = re.search(r'## Work Log\s*\n([\s\S]*?)(?=\n## |\Z)', content)
-    if match:
-        result["work_log"] = match.group(1).strip()
+    text = "\n" + content
+
+    # Session name: the first non-blank "# Session:" title line
+    start = text.find('\n# Session: ')
+    while start != -1:
+        end = text.find('\n', start + 1)
+        name = text[start + 12:end if end != -1 else None].strip()
+        if name:
+            result["name"] = name
+            break
+        start = text.find('\n# Session: ', start + 1)
+
+    # Split once on "## " headers instead of searching the document per section
+    _, *sections = text.split('\n## ')
+
+    # The first matching section wins; Status and Phases only count once they have items
+    seen = set()
+    for i, section in enumerate(sections):
+        header, _, body = section.partition('\n')
+        header = header.rstrip()
+        if header in seen or header not in wanted:
+            continue
+
+        # Lines end with "\n" unless this is the final section of the file
+        if i < len(sections) - 1 or content.endswith('\n'):
+            body += '\n'
+
+        if header == "Status":
+            status = _block_lines(body, _is_status_line)
+            if status:
+                seen.add(header)
+                _parse_status(status, result)
+
+        elif header == "User Request":
+            seen.add(header)
+            result["user_request"] = body.strip()
+
+        elif header == "Phases":
+            items = _block_lines(body, _is_phase_item)
+            if not items:
+                continue
+            seen.add(header)
+
+            # Size the list up front and trim the lines that didn't parse
+            phases = [None] * len(items)
+            n = 0
+            for line in items:
+                phase = _parse_phase_line(line.strip())
+                if phase:
+                    phases[n] = phase
+                    n += 1
+            del phases[n:]
+            result["phases"] = phases
+
+        elif header == "Work Log":
+            seen.add(header)
+            result["work_log"] = body.strip()
 
     return result
 
 
 def format_session(session: dict) -> str:
     """Format session data back to markdown."""
-    phases = "\n".join([
-        f"{p['number']}. [{'x' if p['complete'] else ' '}] {p['agent']} - {p['description']}"
-        for p in session["phases"]
-    ])
+    out = io.StringIO()
+    w = out.write
+    w(f"# Session: {session['name']}\n\n"
+      f"## Status\n"
+      f"- Phase: {session['phase']} of {session['total_phases']}\n"
+      f"- Current Agent: {session['current_agent']}\n"
+      f"- State: {session['state']}\n\n"
+      f"## User Request\n{session['user_request']}\n\n"
+      f"## Phases\n")
+
+    sep = ""
+    for p in session["phases"]:
+        w(f"{sep}{p['number']}. [{_CHECKBOX[p['complete']]}] {p['agent']} - {p['description']}")
+        sep = "\n"
 
     work_log = session.get("work_log") or "(agents will update this)"
-
-    return f"""# Session: {session['name']}
-
-## Status
-- Phase: {session['phase']} of {session['total_phases']}
-- Current Agent: {session['current_agent']}
-- State: {session['state']}
-
-## User Request
-{session['user_request']}
-
-## Phases
-{phases}
-
-## Work Log
-{work_log}
-"""
+    w(f"\n\n## Work Log\n{work_log}\n")
+    return out.getvalue()
+
+
+def _write_session(path: Path, text: str) -> None:
+    """Write the session file through a temp file so readers never see a torn write."""
+    data = text.encode("utf-8")
+    tmp_path = path.with_suffix(".md.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+@dataclass(slots=True)
+class _SessionEntry:
+    """A parsed session file with its phase-completion bits precomputed."""
+    key: tuple[int, int]  # (st_mtime_ns, st_size) of the parsed file
+    session: dict
+    complete_mask: int  # Bit i is set when session["phases"][i] is complete
+    next_index: Optional[int]  # Index of the first incomplete phase, None when all are done
+    sections: frozenset[str]  # Sections decoded into `session`
+    phase_index: dict[int, int]  # Phase number -> index of its first entry in session["phases"]
+
+
+def _index_session(
+    key: tuple[int, int], session: dict, sections: frozenset[str] = SESSION_SECTIONS
+) -> _SessionEntry:
+    mask = 0
+    next_index = None
+    phase_index = {}
+    for i, phase in enumerate(session["phases"]):
+        phase_index.setdefault(phase["number"], i)
+        if phase["complete"]:
+            mask |= 1 << i
+        elif next_index is None:
+            next_index = i
+    return _SessionEntry(key, session, mask, next_index, sections, phase_index)
+
+
+# Parsed session files, keyed by path and validated by (mtime, size)
+_session_cache: dict[Path, _SessionEntry] = {}
+
+
+def _load_session(path: Path, sections: frozenset[str] = SESSION_SECTIONS) -> _SessionEntry:
+    """
+    Parse the session file, re-reading it only when it has changed on disk.
+
+    Only `sections` are guaranteed to be decoded; a cached parse that covers
+    them is reused. Raises FileNotFoundError when there is no session file.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _session_cache.get(path)
+    if cached and cached.key == key:
+        if sections <= cached.sections:
+            return cached
+        sections |= cached.sections
+
+    with open(path, "rb") as f:
+        content = f.read().decode("utf-8")
+    entry = _index_session(key, parse_session(content, sections), sections)
+    _session_cache[path] = entry
+    return entry
 
 
 @mcp.tool()
@@ -119,13 +321,12 @@ def session_get_status() -> str:
     """Get current session status including name, phase, agent, and state."""
     path = get_session_path()
 
-    if not path.exists():
-        return json.dumps({
-            "error": "No session file found",
-            "hint": "Create .claude/tasks/session-current.md"
-        }, indent=2)
+    try:
+        entry = _load_session(path)
+    except FileNotFoundError:
+        return _NO_SESSION_HINT_JSON
 
-    return json.dumps(parse_session(path.read_text()), indent=2)
+    return _dumps(entry.session)
 
 
 @mcp.tool()
@@ -133,27 +334,26 @@ def session_get_next_phase() -> str:
     """Get the next incomplete phase to work on."""
     path = get_session_path()
 
-    if not path.exists():
-        return json.dumps({"error": "No session file found"}, indent=2)
-
-    session = parse_session(path.read_text())
+    try:
+        entry = _load_session(path, _NEXT_PHASE_SECTIONS)
+    except FileNotFoundError:
+        return _NO_SESSION_JSON
+    idx = entry.next_index
+    if idx is None:
+        return _ALL_COMPLETE_JSON
 
-    for phase in session["phases"]:
-        if not phase["complete"]:
-            completed = [p["agent"] for p in session["phases"]
-                        if p["complete"] and p["number"] < phase["number"]]
-            return json.dumps({
-                "phase_number": phase["number"],
-                "agent": phase["agent"],
-                "description": phase["description"],
-                "depends_on": completed,
-                "user_request": session["user_request"],
-            }, indent=2)
+    session = entry.session
+    phases = session["phases"]
+    phase = phases[idx]
 
-    return json.dumps({
-        "all_complete": True,
-        "message": "All phases complete!"
-    }, indent=2)
+    # Phases are listed in order, so everything before idx is complete
+    return _dumps({
+        "phase_number": phase["number"],
+        "agent": phase["agent"],
+        "description": phase["description"],
+        "depends_on": [p["agent"] for p in phases[:idx]],
+        "user_request": session["user_request"],
+    })
 
 
 @mcp.tool()
@@ -164,27 +364,30 @@ def session_mark_phase_complete(
     """Mark a phase as complete and update the session file."""
     path = get_session_path()
 
-    if not path.exists():
-        return json.dumps({"error": "No session file found"}, indent=2)
+    try:
+        entry = _load_session(path)
+    except FileNotFoundError:
+        return _NO_SESSION_JSON
 
-    session = parse_session(path.read_text())
+    idx = entry.phase_index.get(phase_number)
+    if idx is None:
+        return _dumps({"error": f"Phase {phase_number} not found"})
 
-    # Mark phase complete
-    phase_agent = ""
-    for phase in session["phases"]:
-        if phase["number"] == phase_number:
-            phase["complete"] = True
-            phase_agent = phase["agent"]
-            break
-    else:
-        return json.dumps({"error": f"Phase {phase_number} not found"}, indent=2)
+    # The cached parse is updated in place, so drop it until the write lands
+    _session_cache.pop(path, None)
 
-    # Find next phase
-    next_phase = None
-    for phase in session["phases"]:
-        if not phase["complete"]:
-            next_phase = phase
-            break
+    # Mark phase complete
+    session = entry.session
+    phases = session["phases"]
+    phase = phases[idx]
+    phase["complete"] = True
+    phase_agent = phase["agent"]
+
+    # Find next phase; only marking the current one moves it forward
+    next_index = entry.next_index
+    if next_index == idx:
+        next_index = next((i for i in range(idx + 1, len(phases)) if not phases[i]["complete"]), None)
+    next_phase = phases[next_index] if next_index is not None else None
 
     if next_phase:
         session["phase"] = next_phase["number"]
@@ -203,15 +406,26 @@ def session_mark_phase_complete(
             log = f"### Phase {phase_number} ({phase_agent})\n{notes}"
         session["work_log"] = log
 
-    path.write_text(format_session(session))
+    text = format_session(session)
+    _write_session(path, text)
 
-    return json.dumps({
+    # Write through: cache the updated session so the next tool call skips the
+    # read and the parse. It matches a re-parse of the file unless the notes
+    # contain headings that would re-split it.
+    if "\n#" in "\n" + notes:
+        session = parse_session(text)
+    else:
+        session["work_log"] = session["work_log"].strip() or "(agents will update this)"
+    st = path.stat()
+    _session_cache[path] = _index_session((st.st_mtime_ns, st.st_size), session)
+
+    return _dumps({
         "success": True,
         "phase_marked": phase_number,
         "next_phase": next_phase["number"] if next_phase else None,
         "next_agent": next_phase["agent"] if next_phase else None,
         "all_complete": next_phase is None,
-    }, indent=2)
+    })
 
 
 @mcp.tool()
@@ -219,20 +433,21 @@ def session_is_complete() -> str:
     """Check if all phases are complete."""
     path = get_session_path()
 
-    if not path.exists():
-        return json.dumps({"error": "No session file found"}, indent=2)
-
-    session = parse_session(path.read_text())
+    try:
+        entry = _load_session(path, _PHASES_ONLY)
+    except FileNotFoundError:
+        return _NO_SESSION_JSON
+    phases = entry.session["phases"]
+    mask = entry.complete_mask
 
-    completed = [p for p in session["phases"] if p["complete"]]
-    remaining = [p for p in session["phases"] if not p["complete"]]
+    remaining = [p for i, p in enumerate(phases) if not mask >> i & 1]
 
-    return json.dumps({
+    return _dumps({
         "complete": len(remaining) == 0,
-        "completed_count": len(completed),
-        "total_count": len(session["phases"]),
+        "completed_count": mask.bit_count(),
+        "total_count": len(phases),
         "remaining": [f"{p['number']}. {p['agent']} - {p['description']}" for p in remaining],
-    }, indent=2)
+    })
 
 
 if __name__ == "__main__":